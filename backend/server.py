@@ -1,59 +1,106 @@
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+import asyncio
+import hashlib
 import os
 import logging
+import orjson
+import time
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 import uuid
-from datetime import datetime, timezone, date
+from datetime import datetime, timezone, date, timedelta
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncMongoClient(
+    mongo_url,
+    maxPoolSize=50,
+    minPoolSize=5,
+    tz_aware=True,
+    uuidRepresentation="standard",
+    compressors="zstd,zlib"
+)
 db = client[os.environ['DB_NAME']]
 
+class UTCJSONResponse(ORJSONResponse):
+    """orjson response that writes UTC datetimes with a Z suffix, matching pydantic's output"""
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=UTCJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
+# Projection that drops MongoDB's ObjectId, which the models never use
+NO_ID = {"_id": 0}
+
+# Page size bounds for the list endpoints; the frontend reads whole lists without
+# paging, so the default keeps the previous 1000-document cap
+MAX_PAGE_SIZE = 1000
+DEFAULT_PAGE_SIZE = MAX_PAGE_SIZE
+
+# Short-lived cache for dashboard stats, reset by writes that change them
+DASHBOARD_CACHE_TTL = 5  # seconds
+_dash_cache = {"t": 0.0, "day": None, "v": None, "gen": 0}
+_dash_lock = asyncio.Lock()
+
+def invalidate_dashboard_cache():
+    """Force the next dashboard request to recompute its stats"""
+    # Bumping the generation also stops an in-flight recompute from storing pre-write stats
+    _dash_cache["gen"] += 1
+    _dash_cache["t"] = 0.0
+
 # Helper functions for MongoDB date serialization
+def to_mongo_date(value):
+    """Convert a date to a UTC-midnight datetime, stored by MongoDB as a native BSON Date"""
+    return datetime.combine(value, datetime.min.time(), tzinfo=timezone.utc)
+
 def prepare_for_mongo(data):
-    """Convert date objects to ISO format strings for MongoDB storage"""
+    """Convert date objects to BSON Date-compatible datetimes for MongoDB storage"""
     if isinstance(data, dict):
         for key, value in data.items():
-            if isinstance(value, date):
-                data[key] = value.isoformat()
+            if isinstance(value, date) and not isinstance(value, datetime):
+                data[key] = to_mongo_date(value)
     return data
 
 def parse_from_mongo(item):
-    """Convert ISO format strings back to date objects"""
-    if isinstance(item.get('date'), str):
-        try:
-            item['date'] = datetime.fromisoformat(item['date']).date()
-        except:
-            pass
+    """Convert the stored BSON Date back to a date object"""
+    if isinstance(item.get('date'), datetime):
+        item['date'] = item['date'].date()
     return item
 
-def model_to_mongo_dict(model_instance):
-    """Convert Pydantic model to MongoDB-compatible dict"""
-    data = model_instance.dict()
-    return prepare_for_mongo(data)
-
 # Define Models
+# Shared config for models read back from MongoDB. It pins Pydantic v2's defaults
+# so a later edit can't silently turn on slower behaviour such as assignment
+# revalidation; populate_by_name is inert because no model uses aliases
+STORED_MODEL_CONFIG = ConfigDict(
+    extra="ignore",
+    validate_assignment=False,
+    from_attributes=False,
+    arbitrary_types_allowed=False,
+    populate_by_name=True,
+    str_strip_whitespace=False
+)
+
 class JournalEntry(BaseModel):
+    model_config = STORED_MODEL_CONFIG
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     date: date
     content: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime
+    updated_at: datetime
 
 class JournalEntryCreate(BaseModel):
     date: date
@@ -63,12 +110,14 @@ class JournalEntryUpdate(BaseModel):
     content: str
 
 class LifeTask(BaseModel):
+    model_config = STORED_MODEL_CONFIG
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     name: str
     description: Optional[str] = None
     category: Optional[str] = "General"
     target_value: int = 100  # Default target for completion
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime
 
 class LifeTaskCreate(BaseModel):
     name: str
@@ -83,12 +132,14 @@ class LifeTaskUpdate(BaseModel):
     target_value: Optional[int] = None
 
 class ProgressEntry(BaseModel):
+    model_config = STORED_MODEL_CONFIG
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     task_id: str
     date: date
     progress_value: int  # Progress value (0-100 or custom target)
     notes: Optional[str] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime
 
 class ProgressEntryCreate(BaseModel):
     task_id: str
@@ -99,86 +150,97 @@ class ProgressEntryCreate(BaseModel):
 # Journal Entry Routes
 @api_router.post("/journal-entries", response_model=JournalEntry)
 async def create_journal_entry(entry: JournalEntryCreate):
-    entry_dict = entry.dict()
-    entry_dict = prepare_for_mongo(entry_dict)
-    journal_obj = JournalEntry(**entry_dict)
+    now = datetime.now(timezone.utc)
+    journal_obj = JournalEntry(**entry.model_dump(), created_at=now, updated_at=now)
     
-    # Check if entry already exists for this date
-    existing = await db.journal_entries.find_one({"date": entry_dict["date"]})
-    if existing:
+    # Convert to MongoDB-compatible format; the unique index on date rejects duplicates
+    mongo_dict = prepare_for_mongo(journal_obj.model_dump())
+    try:
+        await db.journal_entries.insert_one(mongo_dict)
+    except DuplicateKeyError:
         raise HTTPException(status_code=400, detail="Journal entry already exists for this date")
-    
-    # Convert to MongoDB-compatible format
-    mongo_dict = model_to_mongo_dict(journal_obj)
-    await db.journal_entries.insert_one(mongo_dict)
+    invalidate_dashboard_cache()
     return journal_obj
 
 @api_router.get("/journal-entries", response_model=List[JournalEntry])
-async def get_journal_entries():
-    entries = await db.journal_entries.find().sort("date", -1).to_list(1000)
-    return [JournalEntry(**parse_from_mongo(entry)) for entry in entries]
-
-@api_router.get("/journal-entries/{entry_date}")
-async def get_journal_entry_by_date(entry_date: str):
-    entry = await db.journal_entries.find_one({"date": entry_date})
+async def get_journal_entries(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0)
+):
+    entries = await db.journal_entries.find({}, NO_ID).sort("date", -1).skip(skip).limit(limit).to_list(length=limit)
+    # Stored documents already match the model, so hand them straight to orjson;
+    # response_model only documents the schema, since a returned Response skips validation.
+    # Timestamps go out exactly as stored: BSON Dates render as ...Z, and the list routes
+    # rely on migrate_string_dates rather than normalizing legacy ISO strings themselves
+    return UTCJSONResponse([parse_from_mongo(entry) for entry in entries])
+
+@api_router.get("/journal-entries/{entry_date}", response_model=Optional[JournalEntry])
+async def get_journal_entry_by_date(entry_date: date):
+    entry = await db.journal_entries.find_one({"date": to_mongo_date(entry_date)}, NO_ID)
     if not entry:
         return None
     return JournalEntry(**parse_from_mongo(entry))
 
 @api_router.put("/journal-entries/{entry_date}", response_model=JournalEntry)
-async def update_journal_entry(entry_date: str, entry_update: JournalEntryUpdate):
-    existing = await db.journal_entries.find_one({"date": entry_date})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Journal entry not found")
-    
-    update_dict = entry_update.dict(exclude_unset=True)
+async def update_journal_entry(entry_date: date, entry_update: JournalEntryUpdate):
+    update_dict = entry_update.model_dump(exclude_unset=True)
     update_dict["updated_at"] = datetime.now(timezone.utc)
     
-    await db.journal_entries.update_one(
-        {"date": entry_date}, 
-        {"$set": update_dict}
+    updated_entry = await db.journal_entries.find_one_and_update(
+        {"date": to_mongo_date(entry_date)},
+        {"$set": update_dict},
+        projection=NO_ID,
+        return_document=ReturnDocument.AFTER
     )
-    
-    updated_entry = await db.journal_entries.find_one({"date": entry_date})
+    if updated_entry is None:
+        raise HTTPException(status_code=404, detail="Journal entry not found")
     return JournalEntry(**parse_from_mongo(updated_entry))
 
 @api_router.delete("/journal-entries/{entry_date}")
-async def delete_journal_entry(entry_date: str):
-    result = await db.journal_entries.delete_one({"date": entry_date})
+async def delete_journal_entry(entry_date: date):
+    result = await db.journal_entries.delete_one({"date": to_mongo_date(entry_date)})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Journal entry not found")
+    invalidate_dashboard_cache()
     return {"message": "Journal entry deleted successfully"}
 
 # Life Task Routes
 @api_router.post("/life-tasks", response_model=LifeTask)
 async def create_life_task(task: LifeTaskCreate):
-    task_obj = LifeTask(**task.dict())
-    await db.life_tasks.insert_one(task_obj.dict())
+    task_obj = LifeTask(**task.model_dump(), created_at=datetime.now(timezone.utc))
+    await db.life_tasks.insert_one(task_obj.model_dump())
+    invalidate_dashboard_cache()
     return task_obj
 
 @api_router.get("/life-tasks", response_model=List[LifeTask])
-async def get_life_tasks():
-    tasks = await db.life_tasks.find().sort("created_at", -1).to_list(1000)
-    return [LifeTask(**task) for task in tasks]
+async def get_life_tasks(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0)
+):
+    tasks = await db.life_tasks.find({}, NO_ID).sort("created_at", -1).skip(skip).limit(limit).to_list(length=limit)
+    return UTCJSONResponse(tasks)
 
 @api_router.put("/life-tasks/{task_id}", response_model=LifeTask)
 async def update_life_task(task_id: str, task_update: LifeTaskUpdate):
-    existing = await db.life_tasks.find_one({"id": task_id})
-    if not existing:
+    update_dict = task_update.model_dump(exclude_unset=True)
+    updated_task = await db.life_tasks.find_one_and_update(
+        {"id": task_id},
+        {"$set": update_dict},
+        projection=NO_ID,
+        return_document=ReturnDocument.AFTER
+    )
+    if updated_task is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    
-    update_dict = task_update.dict(exclude_unset=True)
-    await db.life_tasks.update_one({"id": task_id}, {"$set": update_dict})
-    
-    updated_task = await db.life_tasks.find_one({"id": task_id})
     return LifeTask(**updated_task)
 
 @api_router.delete("/life-tasks/{task_id}")
 async def delete_life_task(task_id: str):
-    # Also delete all progress entries for this task
-    await db.progress_entries.delete_many({"task_id": task_id})
-    
-    result = await db.life_tasks.delete_one({"id": task_id})
+    # Also delete all progress entries for this task; the collections are independent
+    _, result = await asyncio.gather(
+        db.progress_entries.delete_many({"task_id": task_id}),
+        db.life_tasks.delete_one({"id": task_id})
+    )
+    invalidate_dashboard_cache()
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Task not found")
     return {"message": "Task deleted successfully"}
@@ -186,75 +248,84 @@ async def delete_life_task(task_id: str):
 # Progress Entry Routes
 @api_router.post("/progress-entries", response_model=ProgressEntry)
 async def create_progress_entry(entry: ProgressEntryCreate):
-    entry_dict = entry.dict()
-    entry_dict = prepare_for_mongo(entry_dict)
-    
-    # Check if progress entry already exists for this task and date
-    existing = await db.progress_entries.find_one({
-        "task_id": entry_dict["task_id"], 
-        "date": entry_dict["date"]
-    })
+    entry_dict = prepare_for_mongo(entry.model_dump())
     
-    if existing:
-        # Update existing entry
-        update_dict = {"progress_value": entry_dict["progress_value"]}
-        if entry_dict.get("notes"):
-            update_dict["notes"] = entry_dict["notes"]
-        
-        await db.progress_entries.update_one(
-            {"task_id": entry_dict["task_id"], "date": entry_dict["date"]},
-            {"$set": update_dict}
-        )
-        updated_entry = await db.progress_entries.find_one({
-            "task_id": entry_dict["task_id"], 
-            "date": entry_dict["date"]
-        })
-        return ProgressEntry(**parse_from_mongo(updated_entry))
+    # Upsert on (task_id, date); only new entries get an id and created_at
+    key = {"task_id": entry_dict["task_id"], "date": entry_dict["date"]}
+    update_dict = {"progress_value": entry_dict["progress_value"]}
+    insert_dict = {
+        "id": str(uuid.uuid4()),
+        "created_at": datetime.now(timezone.utc),
+    }
+    if entry_dict.get("notes"):
+        update_dict["notes"] = entry_dict["notes"]
     else:
-        progress_obj = ProgressEntry(**entry_dict)
-        # Convert to MongoDB-compatible format
-        mongo_dict = model_to_mongo_dict(progress_obj)
-        await db.progress_entries.insert_one(mongo_dict)
-        return progress_obj
-
-@api_router.get("/progress-entries/{task_id}")
-async def get_progress_entries_by_task(task_id: str):
-    entries = await db.progress_entries.find({"task_id": task_id}).sort("date", -1).to_list(1000)
-    return [ProgressEntry(**parse_from_mongo(entry)) for entry in entries]
-
-@api_router.get("/progress-entries/week/{task_id}")
+        insert_dict["notes"] = None
+    
+    updated_entry = await db.progress_entries.find_one_and_update(
+        key,
+        {"$set": update_dict, "$setOnInsert": insert_dict},
+        upsert=True,
+        projection=NO_ID,
+        return_document=ReturnDocument.AFTER
+    )
+    invalidate_dashboard_cache()
+    return ProgressEntry(**parse_from_mongo(updated_entry))
+
+@api_router.get("/progress-entries/{task_id}", response_model=List[ProgressEntry])
+async def get_progress_entries_by_task(
+    task_id: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0)
+):
+    entries = await db.progress_entries.find({"task_id": task_id}, NO_ID).sort("date", -1).skip(skip).limit(limit).to_list(length=limit)
+    return UTCJSONResponse([parse_from_mongo(entry) for entry in entries])
+
+@api_router.get("/progress-entries/week/{task_id}", response_model=List[ProgressEntry])
 async def get_weekly_progress(task_id: str):
     # Get last 7 days of progress for a task
-    from datetime import timedelta
     end_date = date.today()
     start_date = end_date - timedelta(days=6)  # Last 7 days
     
     entries = await db.progress_entries.find({
         "task_id": task_id,
-        "date": {"$gte": start_date.isoformat(), "$lte": end_date.isoformat()}
-    }).sort("date", 1).to_list(7)
+        "date": {"$gte": to_mongo_date(start_date), "$lte": to_mongo_date(end_date)}
+    }, NO_ID).sort("date", 1).to_list(7)
     
-    return [ProgressEntry(**parse_from_mongo(entry)) for entry in entries]
+    return UTCJSONResponse([parse_from_mongo(entry) for entry in entries])
 
 # Dashboard/Stats Routes
 @api_router.get("/stats/dashboard")
 async def get_dashboard_stats():
-    total_entries = await db.journal_entries.count_documents({})
-    total_tasks = await db.life_tasks.count_documents({})
+    today = to_mongo_date(date.today())
     
-    # Get today's journal entry
-    today = date.today().isoformat()
-    today_entry = await db.journal_entries.find_one({"date": today})
-    
-    # Get today's progress entries
-    today_progress = await db.progress_entries.find({"date": today}).to_list(100)
-    
-    return {
-        "total_journal_entries": total_entries,
-        "total_life_tasks": total_tasks,
-        "has_today_journal": bool(today_entry),
-        "today_progress_count": len(today_progress)
-    }
+    # Serve from cache while fresh; the lock keeps concurrent misses from stampeding MongoDB
+    async with _dash_lock:
+        if (
+            _dash_cache["v"] is not None
+            and _dash_cache["day"] == today
+            and time.monotonic() - _dash_cache["t"] < DASHBOARD_CACHE_TTL
+        ):
+            return _dash_cache["v"]
+        
+        generation = _dash_cache["gen"]
+        # The four queries are independent, so issue them concurrently
+        total_entries, total_tasks, today_entry, today_progress = await asyncio.gather(
+            db.journal_entries.estimated_document_count(),
+            db.life_tasks.estimated_document_count(),
+            db.journal_entries.find_one({"date": today}, {"_id": 1}),
+            db.progress_entries.find({"date": today}, {"_id": 1}).to_list(100)
+        )
+        
+        stats = {
+            "total_journal_entries": total_entries,
+            "total_life_tasks": total_tasks,
+            "has_today_journal": bool(today_entry),
+            "today_progress_count": len(today_progress)
+        }
+        if _dash_cache["gen"] == generation:
+            _dash_cache.update(t=time.monotonic(), day=today, v=stats)
+        return stats
 
 # Basic route
 @api_router.get("/")
@@ -264,6 +335,62 @@ async def root():
 # Include the router in the main app
 app.include_router(api_router)
 
+# Read-heavy GET routes answered with an ETag, plus their Cache-Control. All of them
+# revalidate (no-cache) so writes show up immediately; an unchanged body costs a 304
+ETAG_CACHE_CONTROL = {
+    "/api/journal-entries": "private, no-cache",
+    "/api/life-tasks": "private, no-cache",
+    "/api/stats/dashboard": "private, no-cache",
+}
+
+class ETagMiddleware:
+    """Tag cacheable GET responses with a body hash and answer matching revalidations with 304"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        # Everything but the tagged GET routes passes straight through untouched
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return await self.app(scope, receive, send)
+        cache_control = ETAG_CACHE_CONTROL.get(scope["path"])
+        if cache_control is None:
+            return await self.app(scope, receive, send)
+        
+        start = None
+        chunks = []
+        
+        async def buffer_send(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                if start["status"] != 200:
+                    await send(message)
+            elif start["status"] != 200:
+                await send(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+        
+        await self.app(scope, receive, buffer_send)
+        if start is None or start["status"] != 200:
+            return
+        
+        body = b"".join(chunks)
+        etag = '"%s"' % hashlib.sha1(body, usedforsecurity=False).hexdigest()
+        cache_headers = [(b"etag", etag.encode()), (b"cache-control", cache_control.encode())]
+        
+        if_none_match = next((v.decode() for k, v in scope["headers"] if k == b"if-none-match"), "")
+        client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in client_etags or "*" in client_etags:
+            await send({"type": "http.response.start", "status": 304, "headers": cache_headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        await send({**start, "headers": list(start["headers"]) + cache_headers})
+        await send({"type": "http.response.body", "body": body})
+
+app.add_middleware(ETagMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
@@ -279,6 +406,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def migrate_string_dates():
+    """Convert legacy ISO-string dates to BSON Dates; a no-op once no string dates remain"""
+    to_date = [{"$set": {"date": {"$dateFromString": {"dateString": "$date", "timezone": "UTC"}}}}]
+    for collection in (db.journal_entries, db.progress_entries):
+        try:
+            await collection.update_many({"date": {"$type": "string"}}, to_date)
+        except DuplicateKeyError:
+            # Some legacy documents collide with ones already stored under the same Date key;
+            # convert the rest one by one and leave the collisions for manual cleanup
+            async for doc in collection.find({"date": {"$type": "string"}}, {"_id": 1}):
+                try:
+                    await collection.update_one({"_id": doc["_id"]}, to_date)
+                except DuplicateKeyError:
+                    logger.warning("Duplicate date in %s, left unconverted: %s", collection.name, doc["_id"])
+    
+    # Legacy journal_entries and progress_entries timestamps were stored as ISO strings too;
+    # keep any that fail to parse
+    timestamp_fields = (
+        (db.journal_entries, "created_at"),
+        (db.journal_entries, "updated_at"),
+        (db.progress_entries, "created_at"),
+    )
+    for collection, field in timestamp_fields:
+        await collection.update_many(
+            {field: {"$type": "string"}},
+            [{"$set": {field: {"$dateFromString": {"dateString": f"${field}", "onError": f"${field}"}}}}]
+        )
+
+@app.on_event("startup")
+async def ensure_indexes():
+    await db.journal_entries.create_index("date", unique=True)
+    await db.life_tasks.create_index("id", unique=True)
+    await db.life_tasks.create_index("created_at")
+    await db.progress_entries.create_index([("task_id", 1), ("date", 1)], unique=True)
+    await db.progress_entries.create_index("date")
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    await client.close()
\ No newline at end of file
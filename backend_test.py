@@ -1,4 +1,5 @@
-import requests
+import asyncio
+import httpx
 import sys
 import json
 from datetime import datetime, date
@@ -11,78 +12,115 @@ class JournalLifeTrackerAPITester:
         self.tests_run = 0
         self.tests_passed = 0
         self.test_results = []
+        self.client = None
 
-    def run_test(self, name: str, method: str, endpoint: str, expected_status: int, data: Dict[Any, Any] = None, headers: Dict[str, str] = None) -> tuple:
+    async def run_test(self, name: str, method: str, endpoint: str, expected_status: int, data: Dict[Any, Any] = None, headers: Dict[str, str] = None, expected_headers: Dict[str, str] = None) -> tuple:
         """Run a single API test"""
         url = f"{self.api_url}/{endpoint}"
         if headers is None:
             headers = {'Content-Type': 'application/json'}
 
         self.tests_run += 1
-        print(f"\n🔍 Testing {name}...")
-        print(f"   URL: {url}")
+        # Collect output and reserve the result slot up front so concurrent tests
+        # print as whole blocks and are saved in the order they were started
+        lines = [f"\n🔍 Testing {name}...", f"   URL: {url}"]
+        result = {
+            "name": name,
+            "method": method,
+            "endpoint": endpoint,
+            "expected_status": expected_status
+        }
+        self.test_results.append(result)
         
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=10)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=10)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=headers, timeout=10)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=10)
-
-            success = response.status_code == expected_status
+            response = await self.client.request(method, url, json=data, headers=headers, timeout=10)
+
+            mismatched_headers = {
+                key: response.headers.get(key)
+                for key, value in (expected_headers or {}).items()
+                if response.headers.get(key) != value
+            }
+            success = response.status_code == expected_status and not mismatched_headers
             if success:
                 self.tests_passed += 1
-                print(f"✅ Passed - Status: {response.status_code}")
+                lines.append(f"✅ Passed - Status: {response.status_code}")
                 try:
                     response_data = response.json() if response.content else {}
                 except:
                     response_data = {}
+            elif mismatched_headers:
+                lines.append(f"❌ Failed - Expected headers {expected_headers}, got {mismatched_headers}")
+                response_data = {}
             else:
-                print(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
+                lines.append(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
                 try:
                     error_detail = response.json() if response.content else {"error": "No response content"}
-                    print(f"   Error: {error_detail}")
+                    lines.append(f"   Error: {error_detail}")
                 except:
-                    print(f"   Raw response: {response.text}")
+                    lines.append(f"   Raw response: {response.text}")
                 response_data = {}
 
-            self.test_results.append({
-                "name": name,
-                "method": method,
-                "endpoint": endpoint,
-                "expected_status": expected_status,
+            result.update({
                 "actual_status": response.status_code,
                 "success": success,
-                "response_data": response_data
+                "response_data": response_data,
+                "response_headers": dict(response.headers)
             })
 
             return success, response_data
 
         except Exception as e:
-            print(f"❌ Failed - Error: {str(e)}")
-            self.test_results.append({
-                "name": name,
-                "method": method,
-                "endpoint": endpoint,
-                "expected_status": expected_status,
+            lines.append(f"❌ Failed - Error: {str(e)}")
+            result.update({
                 "actual_status": "ERROR",
                 "success": False,
                 "error": str(e)
             })
             return False, {}
 
-    def test_basic_connection(self):
+        finally:
+            print("\n".join(lines))
+
+    async def test_basic_connection(self):
         """Test basic API connection"""
-        return self.run_test("Basic API Connection", "GET", "", 200)
+        return await self.run_test("Basic API Connection", "GET", "", 200)
 
-    def test_dashboard_stats(self):
+    async def test_dashboard_stats(self):
         """Test dashboard stats endpoint"""
-        return self.run_test("Dashboard Stats", "GET", "stats/dashboard", 200)
+        return await self.run_test("Dashboard Stats", "GET", "stats/dashboard", 200)
 
-    def test_journal_operations(self):
+    async def test_http_caching(self):
+        """Test ETag revalidation and Cache-Control on the cacheable GET endpoints"""
+        all_passed = True
+        for endpoint in ("stats/dashboard", "life-tasks"):
+            success, _ = await self.run_test(f"Cache Headers for {endpoint}", "GET", endpoint, 200, expected_headers={"Cache-Control": "private, no-cache"})
+            all_passed &= success
+            
+            etag = self.test_results[-1].get("response_headers", {}).get("etag")
+            if not etag:
+                # Record the missing header as its own failed test so it is counted and saved
+                name = f"ETag Present for {endpoint}"
+                self.tests_run += 1
+                print(f"\n🔍 Testing {name}...\n❌ Failed - No ETag header returned")
+                self.test_results.append({
+                    "name": name,
+                    "method": "GET",
+                    "endpoint": endpoint,
+                    "expected_status": 200,
+                    "actual_status": self.test_results[-1].get("actual_status"),
+                    "success": False,
+                    "error": "No ETag header returned"
+                })
+                all_passed = False
+                continue
+            
+            # Revalidating with the same ETag should skip the body
+            success, _ = await self.run_test(f"Not Modified for {endpoint}", "GET", endpoint, 304, headers={"If-None-Match": etag}, expected_headers={"ETag": etag})
+            all_passed &= success
+        
+        return all_passed
+
+    async def test_journal_operations(self):
         """Test complete journal CRUD operations"""
         today = date.today().isoformat()
         
@@ -91,27 +129,27 @@ class JournalLifeTrackerAPITester:
             "date": today,
             "content": "This is a test journal entry for today."
         }
-        success, response = self.run_test("Create Journal Entry", "POST", "journal-entries", 201, journal_data)
+        success, response = await self.run_test("Create Journal Entry", "POST", "journal-entries", 201, journal_data)
         
         if not success:
             return False
         
-        # Test getting all journal entries
-        success, _ = self.run_test("Get All Journal Entries", "GET", "journal-entries", 200)
-        
-        # Test getting specific journal entry by date
-        success, _ = self.run_test("Get Journal Entry by Date", "GET", f"journal-entries/{today}", 200)
+        # Test getting all journal entries and the specific entry by date
+        await asyncio.gather(
+            self.run_test("Get All Journal Entries", "GET", "journal-entries", 200),
+            self.run_test("Get Journal Entry by Date", "GET", f"journal-entries/{today}", 200)
+        )
         
         # Test updating journal entry
         update_data = {"content": "Updated test journal entry content."}
-        success, _ = self.run_test("Update Journal Entry", "PUT", f"journal-entries/{today}", 200, update_data)
+        success, _ = await self.run_test("Update Journal Entry", "PUT", f"journal-entries/{today}", 200, update_data)
         
         # Test deleting journal entry
-        success, _ = self.run_test("Delete Journal Entry", "DELETE", f"journal-entries/{today}", 200)
+        success, _ = await self.run_test("Delete Journal Entry", "DELETE", f"journal-entries/{today}", 200)
         
         return True
 
-    def test_life_task_operations(self):
+    async def test_life_task_operations(self):
         """Test complete life task CRUD operations"""
         # Test creating life task
         task_data = {
@@ -120,7 +158,7 @@ class JournalLifeTrackerAPITester:
             "category": "Health",
             "target_value": 60
         }
-        success, response = self.run_test("Create Life Task", "POST", "life-tasks", 200, task_data)
+        success, response = await self.run_test("Create Life Task", "POST", "life-tasks", 200, task_data)
         
         if not success:
             return False
@@ -131,7 +169,7 @@ class JournalLifeTrackerAPITester:
             return False
         
         # Test getting all life tasks
-        success, _ = self.run_test("Get All Life Tasks", "GET", "life-tasks", 200)
+        success, _ = await self.run_test("Get All Life Tasks", "GET", "life-tasks", 200)
         
         # Test updating life task
         update_data = {
@@ -139,7 +177,7 @@ class JournalLifeTrackerAPITester:
             "description": "Updated daily exercise routine",
             "target_value": 90
         }
-        success, _ = self.run_test("Update Life Task", "PUT", f"life-tasks/{task_id}", 200, update_data)
+        success, _ = await self.run_test("Update Life Task", "PUT", f"life-tasks/{task_id}", 200, update_data)
         
         # Test progress entry operations
         today = date.today().isoformat()
@@ -149,66 +187,71 @@ class JournalLifeTrackerAPITester:
             "progress_value": 45,
             "notes": "Good progress today"
         }
-        success, _ = self.run_test("Create Progress Entry", "POST", "progress-entries", 200, progress_data)
+        success, _ = await self.run_test("Create Progress Entry", "POST", "progress-entries", 200, progress_data)
         
-        # Test getting progress entries for task
-        success, _ = self.run_test("Get Progress Entries", "GET", f"progress-entries/{task_id}", 200)
-        
-        # Test weekly progress
-        success, _ = self.run_test("Get Weekly Progress", "GET", f"progress-entries/week/{task_id}", 200)
+        # Test getting progress entries for task and weekly progress
+        await asyncio.gather(
+            self.run_test("Get Progress Entries", "GET", f"progress-entries/{task_id}", 200),
+            self.run_test("Get Weekly Progress", "GET", f"progress-entries/week/{task_id}", 200)
+        )
         
         # Test deleting life task (should also delete progress entries)
-        success, _ = self.run_test("Delete Life Task", "DELETE", f"life-tasks/{task_id}", 200)
+        success, _ = await self.run_test("Delete Life Task", "DELETE", f"life-tasks/{task_id}", 200)
         
         return True
 
-    def test_error_handling(self):
+    async def test_error_handling(self):
         """Test API error handling"""
-        # Test getting non-existent journal entry
-        success, _ = self.run_test("Get Non-existent Journal Entry", "GET", "journal-entries/2099-12-31", 200)
-        
-        # Test updating non-existent journal entry
-        update_data = {"content": "This should fail"}
-        success, _ = self.run_test("Update Non-existent Journal Entry", "PUT", "journal-entries/2099-12-31", 404, update_data)
-        
-        # Test deleting non-existent journal entry
-        success, _ = self.run_test("Delete Non-existent Journal Entry", "DELETE", "journal-entries/2099-12-31", 404)
-        
-        # Test updating non-existent life task
-        update_data = {"name": "This should fail"}
-        success, _ = self.run_test("Update Non-existent Life Task", "PUT", "life-tasks/non-existent-id", 404, update_data)
-        
-        # Test deleting non-existent life task
-        success, _ = self.run_test("Delete Non-existent Life Task", "DELETE", "life-tasks/non-existent-id", 404)
+        # The error cases touch no shared state, so run them concurrently
+        await asyncio.gather(
+            # Test getting non-existent journal entry
+            self.run_test("Get Non-existent Journal Entry", "GET", "journal-entries/2099-12-31", 200),
+            # Test updating non-existent journal entry
+            self.run_test("Update Non-existent Journal Entry", "PUT", "journal-entries/2099-12-31", 404, {"content": "This should fail"}),
+            # Test deleting non-existent journal entry
+            self.run_test("Delete Non-existent Journal Entry", "DELETE", "journal-entries/2099-12-31", 404),
+            # Test updating non-existent life task
+            self.run_test("Update Non-existent Life Task", "PUT", "life-tasks/non-existent-id", 404, {"name": "This should fail"}),
+            # Test deleting non-existent life task
+            self.run_test("Delete Non-existent Life Task", "DELETE", "life-tasks/non-existent-id", 404)
+        )
         
         return True
 
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all API tests"""
         print("🚀 Starting Journal & Life Tracker API Tests")
         print(f"📍 Base URL: {self.base_url}")
         print("=" * 60)
         
-        # Test basic connection first
-        success, _ = self.test_basic_connection()
-        if not success:
-            print("❌ Basic API connection failed. Stopping tests.")
-            return False
-        
-        # Test dashboard stats
-        self.test_dashboard_stats()
-        
-        # Test journal operations
-        print("\n📖 Testing Journal Operations...")
-        self.test_journal_operations()
-        
-        # Test life task operations
-        print("\n🎯 Testing Life Task Operations...")
-        self.test_life_task_operations()
-        
-        # Test error handling
-        print("\n🚨 Testing Error Handling...")
-        self.test_error_handling()
+        # Reuse one client so every test shares keep-alive connections
+        async with httpx.AsyncClient() as client:
+            self.client = client
+            
+            # Test basic connection first
+            success, _ = await self.test_basic_connection()
+            if not success:
+                print("❌ Basic API connection failed. Stopping tests.")
+                return False
+            
+            # Test dashboard stats
+            await self.test_dashboard_stats()
+            
+            # Test HTTP caching headers
+            print("\n🗄️  Testing HTTP Caching...")
+            await self.test_http_caching()
+            
+            # Test journal operations
+            print("\n📖 Testing Journal Operations...")
+            await self.test_journal_operations()
+            
+            # Test life task operations
+            print("\n🎯 Testing Life Task Operations...")
+            await self.test_life_task_operations()
+            
+            # Test error handling
+            print("\n🚨 Testing Error Handling...")
+            await self.test_error_handling()
         
         # Print final results
         print("\n" + "=" * 60)
@@ -227,7 +270,7 @@ class JournalLifeTrackerAPITester:
 
 def main():
     tester = JournalLifeTrackerAPITester()
-    success = tester.run_all_tests()
+    success = asyncio.run(tester.run_all_tests())
     
     # Save detailed results
     with open('/app/backend_test_results.json', 'w') as f: